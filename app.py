@@ -12,29 +12,35 @@ Features:
 - Responsive layout using Dash Bootstrap Components
 - Custom hover animations via CSS
 - CSV export button
-- Basic error handling and user feedback
+- Input validation and user feedback
 """
 
 # -------------------------------
 # IMPORTS
 # -------------------------------
+# gzip for compressing the CSV export
+import gzip
+
+# os and ThreadPoolExecutor for compressing large CSV exports in parallel
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 # Dash is the main web framework
 import dash
 
 # dcc (Dash Core Components) = dropdowns, graphs, etc.
 # html (Dash HTML Components) = HTML tags for layout
-# Input, Output = used for callback functionality
-# no_update = prevents unwanted figure refresh if something fails
-from dash import dcc, html, Input, Output, no_update
+# Input, Output, State = used for callback functionality
+from dash import dcc, html, Input, Output, State
 
 # Bootstrap components for responsive layouts and prebuilt styling
 import dash_bootstrap_components as dbc
 
-# pandas for handling and manipulating tabular data
-import pandas as pd
+# plotly.graph_objects for building the chart traces and layouts directly
+import plotly.graph_objects as go
 
-# plotly.express for quick interactive data visualizations
-import plotly.express as px
+# Plotly's default color sequence (used to give each month its own bar color)
+from plotly.colors import qualitative
 
 
 # -------------------------------
@@ -49,8 +55,154 @@ data = {
     "Food": [12000, 13000, 14000, 14500, 15000, 16000],
 }
 
-# Convert the dictionary to a pandas DataFrame
-df = pd.DataFrame(data)
+# Product categories = every column except 'month'
+CATEGORIES = tuple(c for c in data if c != "month")
+
+# Dropdown options, built once for the layout
+CATEGORY_OPTIONS = [{"label": c, "value": c} for c in CATEGORIES]
+
+
+# -------------------------------
+# CHART STYLE
+# -------------------------------
+# Shared styling for the charts, defined once instead of per figure
+
+# One color per month, matching Plotly's default color sequence
+MONTH_COLORS = [
+    qualitative.Plotly[i % len(qualitative.Plotly)]
+    for i in range(len(data["month"]))
+]
+
+BAR_LAYOUT = go.Layout(
+    xaxis_title="month",
+    yaxis_title="Sales ($)",
+    showlegend=False,
+    template="plotly_white",
+)
+
+LINE_LAYOUT = go.Layout(
+    xaxis_title="month",
+    yaxis_title="Sales ($)",
+    template="plotly_white",
+)
+
+
+# -------------------------------
+# PRECOMPUTED FIGURES
+# -------------------------------
+# The data never changes while the app is running, so both charts for every
+# category are built once here at startup instead of on every dropdown change.
+# The results are shipped to the browser in a Store.
+
+def build_category_outputs(selected_category: str) -> dict:
+    """
+    Builds the bar chart and line chart for one category.
+    Figures are returned as plain JSON-ready dicts so they can live in a dcc.Store.
+    """
+    # --- Bar Chart ---
+    bar_fig = go.Figure(
+        data=[
+            go.Bar(
+                x=data["month"],
+                y=data[selected_category],
+                text=data[selected_category],
+                marker_color=MONTH_COLORS,
+                hovertemplate=f"month=%{{x}}<br>{selected_category}=%{{text}}<extra></extra>",
+            )
+        ],
+        layout=BAR_LAYOUT,
+    )
+    bar_fig.update_layout(title=f"Monthly Sales - {selected_category}")
+
+    # --- Line Chart ---
+    line_fig = go.Figure(
+        data=[
+            go.Scatter(
+                x=data["month"],
+                y=data[selected_category],
+                mode="lines+markers",
+                hovertemplate=f"month=%{{x}}<br>{selected_category}=%{{y}}<extra></extra>",
+            )
+        ],
+        layout=LINE_LAYOUT,
+    )
+    line_fig.update_layout(title=f"Sales Trend - {selected_category}")
+
+    # The traces are built from plain lists, so to_plotly_json() already gives
+    # JSON-native dicts/lists/strings that the layout encoder passes straight through
+    return {
+        "bar": bar_fig.to_plotly_json(),
+        "line": line_fig.to_plotly_json(),
+    }
+
+
+# One entry per category
+PRECOMPUTED = {c: build_category_outputs(c) for c in CATEGORIES}
+
+
+# -------------------------------
+# CSV EXPORT
+# -------------------------------
+# Every value except the month name is an integer, so rows are formatted with
+# one precompiled %-format string in large batches, skipping the csv module's
+# per-field quoting checks. Each batch is then gzip-compressed on its own in a
+# thread pool (zlib releases the GIL while compressing), and the compressed
+# batches are joined into one multi-member .gz file, which gzip tools read as
+# a single stream.
+
+CSV_BATCH_ROWS = 16384  # Rows per formatted (and separately compressed) batch
+
+
+def iter_csv_batches():
+    """
+    Yields the sales data as UTF-8 CSV, one bytes object per batch of rows.
+    Month and category names never contain commas or quotes, so no quoting is done.
+    """
+    columns = list(data)
+    header = ",".join(columns) + "\n"
+
+    # "%s" for the month name, "%d" for each category's sales value
+    row_fmt = "%s," + ",".join(["%d"] * (len(columns) - 1)) + "\n"
+
+    # Transpose the column lists into rows (one tuple per month)
+    rows = list(zip(*data.values()))
+    if not rows:
+        yield header.encode()  # No data: the file still gets its header row
+        return
+
+    for start in range(0, len(rows), CSV_BATCH_ROWS):
+        batch = rows[start:start + CSV_BATCH_ROWS]
+        text = "".join(row_fmt % row for row in batch)
+        if start == 0:
+            text = header + text  # Header goes at the top of the first batch
+        yield text.encode()
+
+
+def compress_batch(batch: bytes) -> bytes:
+    """
+    Compresses one CSV batch into a complete gzip member.
+    Level 1 keeps compression cheap; repetitive numeric CSV still shrinks a lot.
+    """
+    return gzip.compress(batch, compresslevel=1)
+
+
+def write_csv_gzip(f) -> None:
+    """
+    Writes the sales data as gzip-compressed CSV to an open binary file (e.g. io.BytesIO).
+    """
+    batches = list(iter_csv_batches())
+
+    # Small exports fit in one batch, so skip the thread pool entirely
+    if len(batches) <= 1:
+        for batch in batches:
+            f.write(compress_batch(batch))
+        return
+
+    # ex.map keeps the batches in their original order
+    workers = min(len(batches), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        for member in ex.map(compress_batch, batches):
+            f.write(member)
 
 
 # -------------------------------
@@ -73,6 +225,12 @@ app.title = "Sales Dashboard"
 
 app.layout = dbc.Container(
     [
+        # ---------- Precomputed Figures (browser-side) ----------
+        dcc.Store(id="precomputed", data=PRECOMPUTED),
+
+        # ---------- Raw Sales Data (browser-side, for the total) ----------
+        dcc.Store(id="sales-data", storage_type="memory", data=data),
+
         # ---------- Header ----------
         html.H1(
             "📈 Sales Dashboard",        # Title text with emoji
@@ -91,11 +249,7 @@ app.layout = dbc.Container(
                         ),
                         dcc.Dropdown(
                             id="category-dropdown",       # Dropdown component ID
-                            options=[
-                                {"label": c, "value": c}  # Create an option for each column
-                                for c in df.columns
-                                if c != "month"           # Skip the 'month' column
-                            ],
+                            options=CATEGORY_OPTIONS,     # One option per category
                             value="Electronics",          # Default selection
                             clearable=False,              # Prevent user from clearing it completely
                         ),
@@ -162,6 +316,7 @@ app.layout = dbc.Container(
                             id="export-msg",       # Message placeholder
                             className="mt-2 fw-semibold"
                         ),
+                        dcc.Download(id="download"),  # Sends the CSV to the browser
                     ],
                     className="text-center",
                 )
@@ -177,83 +332,73 @@ app.layout = dbc.Container(
 # CALLBACKS
 # -------------------------------
 # Dash callbacks connect UI (inputs) to logic (outputs)
-# Whenever the dropdown changes, this callback runs automatically
-
-@app.callback(
+# The dropdown callbacks run in the browser (clientside): the charts are picked
+# out of the "precomputed" Store and the total is summed from the "sales-data"
+# Store, so changing the category never makes a round trip to the Python server.
+# The charts and the total card are updated by separate callbacks so the cheap
+# total text can render without waiting on the two figures.
+
+# Charts callback: swaps in both precomputed figures
+app.clientside_callback(
+    """
+    function(selectedCategory, precomputed) {
+        // --- Input validation: unknown category = leave the charts as they are ---
+        // (own keys only, so inherited names like "constructor" don't match)
+        if (!precomputed || !Object.prototype.hasOwnProperty.call(precomputed, selectedCategory)) {
+            throw window.dash_clientside.PreventUpdate;
+        }
+        const entry = precomputed[selectedCategory];
+        return [entry.bar, entry.line];
+    }
+    """,
     [
         Output("sales-bar-chart", "figure"),   # Update bar chart
         Output("sales-line-chart", "figure"),  # Update line chart
-        Output("total-sales-card", "children") # Update total card text
     ],
     Input("category-dropdown", "value"),       # Trigger input
+    State("precomputed", "data"),              # Figures built at startup
 )
-def update_dashboard(selected_category: str):
-    """
-    Updates both charts and the total sales card based on the selected category.
-    Includes error handling to prevent app crashes if the input is invalid.
+
+
+# Total callback: sums the selected category's sales in the browser
+app.clientside_callback(
     """
-    try:
-        # --- Input validation ---
-        if selected_category not in df.columns:
-            return no_update, no_update, "⚠️ Invalid category selected."
-
-        # --- Bar Chart ---
-        bar_fig = px.bar(
-            df,
-            x="month",
-            y=selected_category,
-            title=f"Monthly Sales - {selected_category}",
-            color="month",
-            text=selected_category,
-        )
-        bar_fig.update_layout(
-            showlegend=False, 
-            yaxis_title="Sales ($)", 
-            template="plotly_white"
-        )
-
-        # --- Line Chart ---
-        line_fig = px.line(
-            df,
-            x="month",
-            y=selected_category,
-            markers=True,
-            title=f"Sales Trend - {selected_category}",
-        )
-        line_fig.update_layout(
-            yaxis_title="Sales ($)", 
-            template="plotly_white"
-        )
-
-        # --- Total Sales Calculation ---
-        total_sales = df[selected_category].sum()
-        total_text = f"${total_sales:,.0f}"  # Format with commas and $ sign
-
-        return bar_fig, line_fig, total_text
-
-    except Exception as e:
-        # Catch unexpected runtime errors and display a friendly message
-        error_msg = f"An error occurred while updating: {e}"
-        return no_update, no_update, error_msg
-
-
-# Second callback: triggered when user clicks "Export CSV"
+    function(selectedCategory, salesData, precomputed) {
+        // --- Input validation: same category set as the charts callback ---
+        if (!precomputed || !Object.prototype.hasOwnProperty.call(precomputed, selectedCategory)) {
+            throw window.dash_clientside.PreventUpdate;
+        }
+        const total = salesData[selectedCategory].reduce((a, b) => a + b, 0);
+        return "$" + total.toLocaleString("en-US");  // Format with commas and $ sign
+    }
+    """,
+    Output("total-sales-card", "children"),    # Update total card text
+    Input("category-dropdown", "value"),       # Trigger input
+    State("sales-data", "data"),               # Raw monthly sales
+    State("precomputed", "data"),              # Keys = valid categories
+)
+
+
+# Export callback: triggered when user clicks "Export CSV"
 @app.callback(
-    Output("export-msg", "children"),  # Text message area
+    [
+        Output("download", "data"),        # File sent to the browser
+        Output("export-msg", "children"),  # Text message area
+    ],
     Input("export-btn", "n_clicks"),   # Button click trigger
     prevent_initial_call=True          # Ignore the first render
 )
 def export_csv(n_clicks: int):
     """
-    Exports the DataFrame to a CSV file and confirms success to the user.
-    Includes error handling for file write issues.
+    Sends the sales data to the browser as a gzip-compressed CSV download
+    and tells the user the export was sent (the message arrives with the file,
+    before the browser has saved it).
+    Nothing is written to the server's disk, so concurrent exports can't clash.
     """
-    try:
-        filename = "sales_data.csv"
-        df.to_csv(filename, index=False)
-        return f"Data exported successfully as {filename}"
-    except Exception as e:
-        return f"Failed to export data: {e}"
+    filename = "sales_data.csv.gz"
+    # The compressed CSV is written straight into an in-memory buffer
+    download = dcc.send_bytes(write_csv_gzip, filename, type="application/gzip")
+    return download, f"Export sent as {filename}"
 
 
 # -------------------------------